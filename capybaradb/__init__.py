@@ -11,6 +11,7 @@ This package provides a simple, intuitive interface for:
 
 Key components:
 - CapybaraDB: Main client class for connecting to the service
+- AsyncCollection: Asynchronous collection interface for concurrent requests (requires the `async` extra)
 - EmbText: Special data type for text that will be automatically embedded
 - EmbModels: Constants for supported embedding models
 - EmbImage: Special data type for images that can be processed by vision models
@@ -138,10 +139,11 @@ For more information, see the documentation at https://capybaradb.co/docs
 """
 
 from ._client import CapybaraDB
+from ._async_collection import AsyncCollection
 from ._emb_json._emb_text import EmbText
 from ._emb_json._emb_models import EmbModels
 from ._emb_json._emb_image import EmbImage
 from ._emb_json._vision_models import VisionModels
 import bson
 
-__all__ = ["CapybaraDB", "EmbText", "EmbModels", "EmbImage", "VisionModels", "bson"]
+__all__ = ["CapybaraDB", "AsyncCollection", "EmbText", "EmbModels", "EmbImage", "VisionModels", "bson"]
@@ -0,0 +1,198 @@
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency (capybaradb[async])
+    httpx = None
+
+from ._types import QueryResponse
+from ._collection import _build_headers, _serialize, _dumps, _handle_response
+
+
+class AsyncCollection:
+    """
+    AsyncCollection - Asynchronous counterpart of Collection
+
+    AsyncCollection exposes the same operations as Collection (insert, update, delete,
+    find and query) as coroutines. Requests are sent through a single httpx.AsyncClient
+    with HTTP/2 enabled, so concurrent calls are multiplexed as streams over one
+    TLS connection instead of each opening its own socket. Independent calls awaited
+    together with asyncio.gather overlap their network waits, so ten queries take
+    roughly one round trip instead of ten.
+
+    Call `aclose()` (or use the collection as an async context manager) when done
+    to release the connection.
+
+    This class requires the optional `async` extra:
+        ```bash
+        pip install "capybaradb[async]"
+        ```
+
+    Usage:
+        ```python
+        import asyncio
+        from capybaradb import CapybaraDB
+
+        async def main():
+            client = CapybaraDB()
+            async with client.my_database.async_collection("my_collection") as collection:
+                # Run several semantic searches concurrently
+                results = await asyncio.gather(
+                    collection.query("machine learning"),
+                    collection.query("vector databases"),
+                    collection.find({"category": "AI"}),
+                )
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self, api_key: str, project_id: str, db_name: str, collection_name: str
+    ):
+        """
+        Creates a new AsyncCollection instance.
+
+        Note: You typically don't need to create this directly.
+        Instead, use the `async_collection()` method on a Database instance.
+
+        Args:
+            api_key: API key for authentication
+            project_id: Project ID that identifies your CapybaraDB project
+            db_name: Name of the database containing this collection
+            collection_name: Name of this collection
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncCollection requires httpx. Install it with: pip install \"capybaradb[async]\""
+            )
+
+        self.api_key = api_key
+        self.project_id = project_id
+        self.db_name = db_name
+        self.collection_name = collection_name
+
+        # URLs and headers depend only on the fields above, so build them once
+        self._base_url = f"https://api.capybaradb.co/v0/db/{project_id}_{db_name}/collection/{collection_name}/document"
+        self._find_url = f"{self._base_url}/find"
+        self._query_url = f"{self._base_url}/query"
+        self._headers = _build_headers(api_key)
+        # Created on first request, so collections that are never used don't pay for
+        # setting up an HTTP client and its TLS context.
+        self._client = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60,
+                ),
+                # Retry failed connection attempts; httpx doesn't retry on status codes
+                retries=3,
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                headers=self._headers,
+                timeout=httpx.Timeout(30, connect=5),
+            )
+        return self._client
+
+    def get_collection_url(self) -> str:
+        return self._base_url
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncCollection":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def insert(self, documents: list[dict]) -> dict:
+        """
+        Insert one or more documents into the collection.
+
+        See Collection.insert for details.
+        """
+        url = self._base_url
+        serialized_docs = [_serialize(doc) for doc in documents]
+        data = {"documents": serialized_docs}
+
+        response = await self._get_client().request("POST", url, content=_dumps(data))
+        return _handle_response(response)
+
+    async def update(self, filter: dict, update: dict, upsert: bool = False) -> dict:
+        url = self._base_url
+        data = {
+            "filter": _serialize(filter),
+            "update": _serialize(update),
+            "upsert": upsert,
+        }
+
+        response = await self._get_client().request("PUT", url, content=_dumps(data))
+        return _handle_response(response)
+
+    async def delete(self, filter: dict) -> dict:
+        url = self._base_url
+        data = {"filter": _serialize(filter)}
+
+        response = await self._get_client().request("DELETE", url, content=_dumps(data))
+        return _handle_response(response)
+
+    async def find(
+        self,
+        filter: dict,
+        projection: dict = None,
+        sort: dict = None,
+        limit: int = None,
+        skip: int = None,
+    ) -> list[dict]:
+        url = self._find_url
+        options = (
+            ("projection", projection),
+            ("sort", sort),
+            ("limit", limit),
+            ("skip", skip),
+        )
+        data = {"filter": _serialize(filter), **{k: v for k, v in options if v is not None}}
+
+        response = await self._get_client().request("POST", url, content=_dumps(data))
+        return _handle_response(response)
+
+    async def query(
+        self,
+        query: str,
+        filter: dict = None,
+        projection: dict = None,
+        emb_model: str = None,
+        top_k: int = None,
+        include_values: bool = None,
+    ) -> QueryResponse:
+        """
+        Perform a semantic search query on the collection.
+
+        See Collection.query for details on the arguments and the response.
+        """
+        url = self._query_url
+
+        options = (
+            ("filter", filter),
+            ("projection", projection),
+            ("emb_model", emb_model),
+            ("top_k", top_k),
+            ("include_values", include_values),
+        )
+        data = {"query": query, **{k: v for k, v in options if v is not None}}
+
+        response = await self._get_client().request("POST", url, content=_dumps(data))
+        return _handle_response(response)
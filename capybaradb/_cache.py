@@ -0,0 +1,56 @@
+from collections import OrderedDict
+import threading
+import time
+
+
+class TTLCache:
+    """
+    A small thread-safe LRU cache whose entries expire a fixed time after being stored.
+
+    Used by Collection to keep recent query results so that repeated identical
+    queries (agent loops, retries, chatbots) don't go back to the network.
+
+    `generation` is bumped by every clear(). A caller that read a value from the
+    server passes the generation it saw before the request to set(), so a response
+    that raced with a write is dropped instead of being cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries; the least recently used entry is evicted first
+            ttl: Number of seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the value stored for key, or None if it is missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation: int = None) -> None:
+        """Store value for key, unless the cache was cleared after `generation` was read."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
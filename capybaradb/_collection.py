@@ -8,15 +8,27 @@ from bson import (
     Decimal128,
     Binary,
 )
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+import atexit
+import itertools
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ._types import QueryResponse
+from ._cache import TTLCache
 from ._emb_json._emb_text import EmbText
 from ._emb_json._emb_image import EmbImage
 
+# EmbJSON types serialize themselves through to_json(). The set gives a single
+# exact-type lookup on the hot path; the tuple catches subclasses.
+_EMB_TYPES = (EmbText, EmbImage)
+_EMB_TYPE_SET = frozenset(_EMB_TYPES)
+
 # Map specific BSON types to their serialization logic
 # This mapping enables automatic conversion of complex data types when sending data to CapybaraDB:
-# - EmbText: Special CapybaraDB type for text that will be automatically embedded
 # - ObjectId: MongoDB-style unique identifiers
 # - datetime: Python datetime objects
 # - Decimal128: High-precision decimal numbers
@@ -26,7 +38,6 @@ from ._emb_json._emb_image import EmbImage
 # - Timestamp: Precise timestamps
 # - MinKey/MaxKey: Special BSON types for comparison operations
 BSON_SERIALIZERS = {
-    EmbText: lambda v: {"@embText": v.to_json()},
     ObjectId: lambda v: {"$oid": str(v)},
     datetime: lambda v: {"$date": v.isoformat()},
     Decimal128: lambda v: {"$numberDecimal": str(v)},
@@ -38,6 +49,210 @@ BSON_SERIALIZERS = {
     MaxKey: lambda v: {"$maxKey": 1},
 }
 
+# Types that are already JSON-compatible and pass through serialization unchanged
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# HTTP sessions shared by every Collection that uses the same API key.
+# Reusing a session keeps HTTPS connections alive between calls, so only the
+# first request pays for the TCP and TLS handshakes.
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _build_headers(api_key: str) -> dict:
+    """Headers sent with every API request."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _retry_policy(methods) -> Retry:
+    """
+    Build the retry policy for transient failures: connection errors, rate limiting
+    (429) and gateway errors (502/503/504) are retried with exponential backoff and
+    jitter, honouring any Retry-After header sent by the server.
+    """
+    return Retry(
+        total=5,
+        connect=3,
+        read=3,
+        status=5,
+        backoff_factor=0.3,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(methods),
+        respect_retry_after_header=True,
+        # Hand the final response to handle_response instead of raising
+        raise_on_status=False,
+    )
+
+
+def _get_session(api_key: str, retry_writes: bool = True) -> requests.Session:
+    """
+    Return the pooled HTTP session for the given API key, creating it on first use.
+    
+    find/query are POST requests that only read, so they are retried like the other
+    verbs. Inserts (POST) and updates (PUT) are not idempotent, e.g. a retried $inc
+    or $push is applied twice; they use the session created with retry_writes=False
+    unless the caller opts in.
+    """
+    key = (api_key, retry_writes)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            methods = {"GET", "PUT", "DELETE", "POST"} if retry_writes else {"GET", "DELETE"}
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=_retry_policy(methods),
+            )
+            session.mount("https://", adapter)
+            session.headers.update(_build_headers(api_key))
+            _SESSIONS[key] = session
+        return session
+
+
+# find/query requests currently on the wire, keyed by API key, URL and request body.
+# Identical requests issued while one is already in flight wait for its response
+# instead of sending their own copy (see Collection._post_coalesced).
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _finish_inflight(key, entry) -> None:
+    # A request started after a write may have replaced this entry; leave it alone.
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT.get(key) is entry:
+            del _INFLIGHT[key]
+
+
+# Recent successful find/query responses, one cache per (API key, collection). Writes
+# made through any Collection for the same collection clear its cache.
+_QUERY_CACHE_SIZE = 1024
+_QUERY_CACHE_TTL = 60.0
+_QUERY_CACHES = {}
+_QUERY_CACHES_LOCK = threading.Lock()
+
+
+def _get_query_cache(api_key: str, collection_url: str) -> TTLCache:
+    with _QUERY_CACHES_LOCK:
+        cache = _QUERY_CACHES.get((api_key, collection_url))
+        if cache is None:
+            cache = TTLCache(_QUERY_CACHE_SIZE, _QUERY_CACHE_TTL)
+            _QUERY_CACHES[(api_key, collection_url)] = cache
+        return cache
+
+
+class _InsertQueue:
+    """
+    Documents queued by Collection.insert_async for one collection, plus the background
+    thread that sends them in batches.
+
+    One queue is shared by every Collection for the same (API key, collection), so the
+    usual `client.my_database.my_collection.insert_async(...)` pattern, which builds a new
+    Collection on each attribute access, still batches into a single queue and thread.
+    """
+
+    def __init__(self, send, wait_time: float, max_rows: int):
+        """
+        Args:
+            send: Callable that inserts a list of serialized documents and returns the result
+            wait_time: Seconds between background flushes
+            max_rows: Number of queued documents that triggers an immediate flush
+        """
+        self._send = send
+        self.wait_time = wait_time
+        self.max_rows = max_rows
+        self._buf = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="capybaradb-insert-flusher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, serialized: dict, future: Future) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot insert into a closed collection.")
+            self._buf.append((serialized, future))
+            if len(self._buf) >= self.max_rows:
+                self._flush_event.set()
+
+    def _run(self):
+        while not self._closed:
+            self._flush_event.wait(self.wait_time)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Errors from a batch are delivered through its futures; anything else
+                # must not stop the thread, or later documents would never be sent.
+                pass
+
+    def flush(self) -> None:
+        # Holding the flush lock for the whole drain makes flush() wait for a batch
+        # the background thread may be sending at the same time.
+        with self._flush_lock:
+            with self._lock:
+                pending, self._buf = self._buf, []
+            # Drop documents whose future was cancelled; the rest can no longer be cancelled
+            pending = [
+                (doc, future)
+                for doc, future in pending
+                if future.set_running_or_notify_cancel()
+            ]
+
+            max_rows = self.max_rows
+            for start in range(0, len(pending), max_rows):
+                batch = pending[start : start + max_rows]
+                try:
+                    result = self._send([doc for doc, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        future.set_result(result)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._flush_event.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+        self.flush()
+
+
+# Insert queues keyed by (API key, collection URL); see _InsertQueue
+_INSERT_QUEUES = {}
+_INSERT_QUEUES_LOCK = threading.Lock()
+
+# map_query worker pools keyed by (API key, collection URL). Collection objects are
+# created on every `client.my_database.my_collection` access, so a per-object pool
+# would let concurrent callers exceed max_concurrency.
+_QUERY_EXECUTORS = {}
+_QUERY_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_query_executor(api_key: str, collection_url: str, max_workers: int) -> ThreadPoolExecutor:
+    with _QUERY_EXECUTORS_LOCK:
+        executor = _QUERY_EXECUTORS.get((api_key, collection_url))
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="capybaradb-query"
+            )
+            _QUERY_EXECUTORS[(api_key, collection_url)] = executor
+        return executor
+
 
 class APIClientError(Exception):
     """
@@ -86,6 +301,225 @@ class ServerError(APIClientError):
     pass
 
 
+def _serialize_leaf(value):
+    """
+    Serialize a single non-container value (primitive, EmbJSON or BSON type).
+    """
+    # Exact type lookups first: these cover almost every leaf in practice
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+
+    if value_type in _EMB_TYPE_SET:
+        return value.to_json()
+
+    # Check if the value matches a BSON-specific type
+    serializer = BSON_SERIALIZERS.get(value_type)
+    if serializer:
+        return serializer(value)
+
+    if isinstance(value, _EMB_TYPES):
+        return value.to_json()
+
+    # Subclasses of primitive types (e.g. enums deriving from str) are JSON-compatible too
+    if isinstance(value, (bool, int, float, str)):
+        return value
+
+    # Fallback for unsupported types
+    raise TypeError(f"Unsupported BSON type: {type(value)}")
+
+
+def _iter_items(container):
+    """Iterate (key, value) pairs of a dict or (index, value) pairs of a list."""
+    return iter(container.items()) if isinstance(container, dict) else enumerate(container)
+
+
+def _shallow_copy(container):
+    return dict(container) if isinstance(container, dict) else list(container)
+
+
+def _serialize(value):
+    """
+    Efficiently serialize BSON types, EmbText, and nested structures into JSON-compatible formats.
+
+    Nested dicts and lists are walked with an explicit stack rather than recursion, so
+    deeply nested documents don't pay for a Python call per level. The input is never
+    modified: a container is copied only once one of its items actually needs converting,
+    and subtrees holding nothing but plain JSON values are returned as-is. For a plain
+    document this is a single scan with no allocations.
+    """
+    if not isinstance(value, (dict, list)):
+        return _serialize_leaf(value)
+
+    # Each frame is [container, item iterator, converted copy or None, key in parent]
+    stack = [[value, _iter_items(value), None, None]]
+    while True:
+        frame = stack[-1]
+        container = frame[0]
+        for key, item in frame[1]:
+            if type(item) in _JSON_SCALAR_TYPES:
+                continue
+            if isinstance(item, (dict, list)):
+                # Descend; this frame resumes from its iterator once the child is done
+                stack.append([item, _iter_items(item), None, key])
+                break
+            converted = _serialize_leaf(item)
+            if converted is not item:
+                if frame[2] is None:
+                    frame[2] = _shallow_copy(container)
+                frame[2][key] = converted
+        else:
+            stack.pop()
+            result = container if frame[2] is None else frame[2]
+            if not stack:
+                return result
+            if result is not container:
+                parent = stack[-1]
+                if parent[2] is None:
+                    parent[2] = _shallow_copy(parent[0])
+                parent[2][frame[3]] = result
+
+
+def _check_serializable(value) -> None:
+    """
+    Raise the TypeError that _serialize would raise for value, without converting anything.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if (
+            item_type in _JSON_SCALAR_TYPES
+            or item_type in _EMB_TYPE_SET
+            or item_type in BSON_SERIALIZERS
+        ):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif not isinstance(item, (*_EMB_TYPES, bool, int, float, str)):
+            raise TypeError(f"Unsupported BSON type: {type(item)}")
+
+
+def _deserialize(value, depth=0):
+    """
+    Recursively convert JSON-compatible structures back to BSON types and EmbText.
+    """
+    if isinstance(value, dict):
+        # Quickly check if any keys indicate BSON special types
+        for key in value:
+            if "@embText" in value:
+                return EmbText.from_json(value["@embText"])
+            if "@embImage" in value:
+                return EmbImage.from_json(value["@embImage"])
+            elif key.startswith("$"):
+                if key == "$oid":
+                    return ObjectId(value["$oid"])
+                if key == "$date":
+                    return datetime.fromisoformat(value["$date"])
+                if key == "$numberDecimal":
+                    return Decimal128(value["$numberDecimal"])
+                if key == "$binary":
+                    return Binary(bytes.fromhex(value["$binary"]))
+                if key == "$regex":
+                    return Regex(value["$regex"], value.get("$options", 0))
+                if key == "$code":
+                    return Code(value["$code"])
+                if key == "$timestamp":
+                    return Timestamp(
+                        value["$timestamp"]["t"], value["$timestamp"]["i"]
+                    )
+                if key == "$minKey":
+                    return MinKey()
+                if key == "$maxKey":
+                    return MaxKey()
+
+        # Fallback: Regular recursive deserialization for non-BSON keys
+        return {k: _deserialize(v, depth + 1) for k, v in value.items()}
+
+    elif isinstance(value, list):
+        return [_deserialize(item, depth + 1) for item in value]
+
+    elif value is None:
+        return None
+
+    elif isinstance(value, (bool, int, float, str)):
+        return value
+
+    else:
+        raise TypeError(
+            f"Unsupported BSON type during deserialization: {type(value)}"
+        )
+
+
+def _dumps(data) -> bytes:
+    """
+    Encode a request body as JSON bytes.
+
+    orjson is considerably faster than the stdlib json module that requests uses,
+    which matters for inserts carrying large base64-encoded images.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Insert bodies are streamed in pieces of roughly this many bytes (see _iter_insert_body)
+_INSERT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_insert_body(serialized_docs):
+    """
+    Yield the JSON body of an insert request piece by piece.
+
+    Documents are encoded one at a time, so a large batch (e.g. many base64 images)
+    never has its full encoded body in memory, and the socket can send one piece
+    while the next document is being encoded. serialized_docs may be a generator
+    that serializes each document as it is reached.
+    """
+    buf = bytearray(b'{"documents":[')
+    for i, doc in enumerate(serialized_docs):
+        if i:
+            buf += b","
+        buf += _dumps(doc)
+        if len(buf) >= _INSERT_CHUNK_SIZE:
+            yield bytes(buf)
+            buf.clear()
+    buf += b"]}"
+    yield bytes(buf)
+
+
+def _handle_response(response):
+    """
+    Deserialize a successful API response or raise the matching APIClientError.
+
+    The body is parsed at most once. Works with both requests and httpx responses,
+    which share the attributes used here.
+    """
+    body = response.content
+    if 200 <= response.status_code < 300:
+        return _deserialize(orjson.loads(body)) if body else {}
+
+    try:
+        error_data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        if response.status_code == 429:
+            # Rate limiting that outlasted the retries; proxies often send a plain-text body
+            raise ClientRequestError(429, body.decode("utf-8", "replace"))
+        raise APIClientError(response.status_code, body.decode("utf-8", "replace"))
+    if not isinstance(error_data, dict):
+        raise APIClientError(response.status_code, body.decode("utf-8", "replace"))
+
+    code = error_data.get("code", response.status_code)
+    message = error_data.get("message", "An unknown error occurred.")
+
+    if code == 401:
+        raise AuthenticationError(code, message)
+    elif code >= 400 and code < 500:
+        raise ClientRequestError(code, message)
+    else:
+        raise ServerError(code, message)
+
+
 class Collection:
     """
     Collection - Represents a collection in CapybaraDB
@@ -96,6 +530,8 @@ class Collection:
     - delete: Remove documents
     - find: Retrieve documents based on filters
     - query: Perform semantic searches on embedded text fields
+    - insert_async: Buffer documents and insert them in batches from a background thread
+    - map_query: Run many semantic searches in parallel with bounded concurrency
     
     Collections in CapybaraDB are similar to collections in MongoDB or tables in SQL databases.
     They store documents (JSON objects) that can contain embedded text fields for semantic search.
@@ -173,6 +609,15 @@ class Collection:
         results = collection.query("product with blue background")
         ```
     """
+
+    # Buffered inserts (insert_async) are sent once this many seconds have passed
+    # or this many documents are waiting, whichever comes first. The values of the
+    # Collection that first queues a document for a collection apply to its queue.
+    async_insert_wait_time = 0.2
+    async_insert_max_rows = 1000
+
+    # Upper bound on parallel requests made by map_query
+    max_concurrency = 5
     
     def __init__(
         self, api_key: str, project_id: str, db_name: str, collection_name: str
@@ -194,118 +639,28 @@ class Collection:
         self.db_name = db_name
         self.collection_name = collection_name
 
-    def get_collection_url(self) -> str:
-        return f"https://api.capybaradb.co/v0/db/{self.project_id}_{self.db_name}/collection/{self.collection_name}/document"
-
-    def get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-    def __serialize(self, value):
-        """
-        Efficiently serialize BSON types, EmbText, and nested structures into JSON-compatible formats.
-        """
-        # Early return for primitive JSON-compatible types
-        if value is None or isinstance(value, (bool, int, float, str)):
-            return value
-
-        # Handle dictionaries (fast path)
-        if isinstance(value, dict):
-            return {k: self.__serialize(v) for k, v in value.items()}
-
-        # Handle lists (fast path)
-        if isinstance(value, list):
-            return [self.__serialize(item) for item in value]
-
-        if isinstance(value, EmbText):
-            return value.to_json()
-            
-        if isinstance(value, EmbImage):
-            return value.to_json()
-
-        # Check if the value matches a BSON-specific type
-        serializer = BSON_SERIALIZERS.get(type(value))
-        if serializer:
-            return serializer(value)
+        # URLs depend only on the fields above, so build them once. Headers are set
+        # once on the shared session.
+        self._base_url = f"https://api.capybaradb.co/v0/db/{project_id}_{db_name}/collection/{collection_name}/document"
+        self._find_url = f"{self._base_url}/find"
+        self._query_url = f"{self._base_url}/query"
+        self._session = _get_session(api_key)
+        self._write_session = _get_session(api_key, retry_writes=False)
+        self._query_cache = _get_query_cache(api_key, self._base_url)
 
-        # Fallback for unsupported types
-        raise TypeError(f"Unsupported BSON type: {type(value)}")
+        # Set by close(); the insert_async queue itself is shared per collection
+        self._closed = False
 
-    def __deserialize(self, value, depth=0):
-        """
-        Recursively convert JSON-compatible structures back to BSON types and EmbText.
-        """
-        if isinstance(value, dict):
-            # Quickly check if any keys indicate BSON special types
-            for key in value:
-                if "@embText" in value:
-                    return EmbText.from_json(value["@embText"])
-                if "@embImage" in value:
-                    return EmbImage.from_json(value["@embImage"])
-                elif key.startswith("$"):
-                    if key == "$oid":
-                        return ObjectId(value["$oid"])
-                    if key == "$date":
-                        return datetime.fromisoformat(value["$date"])
-                    if key == "$numberDecimal":
-                        return Decimal128(value["$numberDecimal"])
-                    if key == "$binary":
-                        return Binary(bytes.fromhex(value["$binary"]))
-                    if key == "$regex":
-                        return Regex(value["$regex"], value.get("$options", 0))
-                    if key == "$code":
-                        return Code(value["$code"])
-                    if key == "$timestamp":
-                        return Timestamp(
-                            value["$timestamp"]["t"], value["$timestamp"]["i"]
-                        )
-                    if key == "$minKey":
-                        return MinKey()
-                    if key == "$maxKey":
-                        return MaxKey()
-
-            # Fallback: Regular recursive deserialization for non-BSON keys
-            return {k: self.__deserialize(v, depth + 1) for k, v in value.items()}
-
-        elif isinstance(value, list):
-            return [self.__deserialize(item, depth + 1) for item in value]
-
-        elif value is None:
-            return None
-
-        elif isinstance(value, (bool, int, float, str)):
-            return value
+    def get_collection_url(self) -> str:
+        return self._base_url
 
-        else:
-            raise TypeError(
-                f"Unsupported BSON type during deserialization: {type(value)}"
-            )
+    def get_headers(self) -> dict:
+        return _build_headers(self.api_key)
 
     def handle_response(self, response):
-        try:
-            response.raise_for_status()
-            json_response = response.json()
-            return self.__deserialize(json_response)
-        except requests.exceptions.HTTPError as e:
-            try:
-                error_data = response.json()
-                status = error_data.get("status", "error")
-                code = error_data.get("code", 500)
-                message = error_data.get("message", "An unknown error occurred.")
-
-                if code == 401:
-                    raise AuthenticationError(code, message) from e
-                elif code >= 400 and code < 500:
-                    raise ClientRequestError(code, message) from e
-                else:
-                    raise ServerError(code, message) from e
+        return _handle_response(response)
 
-            except ValueError:
-                raise APIClientError(response.status_code, response.text) from e
-
-    def insert(self, documents: list[dict]) -> dict:
+    def insert(self, documents: list[dict], retryable: bool = False) -> dict:
         """
         Insert one or more documents into the collection.
         
@@ -316,39 +671,155 @@ class Collection:
         
         Args:
             documents: List of documents to insert
+            retryable: Retry the request on transient failures (rate limiting, gateway
+                       errors, dropped connections). Inserts are not idempotent, so only
+                       enable this when a duplicate insert is harmless, e.g. when the
+                       documents carry their own unique keys.
             
         Returns:
             Dictionary with insertion result information
         """
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        serialized_docs = [self.__serialize(doc) for doc in documents]
-        data = {"documents": serialized_docs}
-
-        response = requests.post(url, headers=headers, json=data)
+        # Serialize lazily so that only the documents in the piece being sent have their
+        # serialized copies (e.g. base64 of raw image bytes) alive at once. Types are
+        # checked up front so an unsupported value fails before the upload starts.
+        for doc in documents:
+            _check_serializable(doc)
+        serialized_docs = (_serialize(doc) for doc in documents)
+        return self._insert_serialized(serialized_docs, retryable)
+
+    def _insert_serialized(self, serialized_docs, retryable: bool = False) -> dict:
+        url = self._base_url
+        pieces = _iter_insert_body(serialized_docs)
+
+        if retryable:
+            # A retry has to resend the body, so it can't be a one-shot stream
+            response = self._session.post(url, data=b"".join(pieces))
+        else:
+            # Bodies that fit in one piece are sent whole; larger ones are streamed
+            # with chunked transfer encoding.
+            first = next(pieces)
+            second = next(pieces, None)
+            if second is None:
+                body = first
+            else:
+                body = itertools.chain((first, second), pieces)
+            response = self._write_session.post(url, data=body)
+        self._query_cache.clear()
         return self.handle_response(response)
 
-    def update(self, filter: dict, update: dict, upsert: bool = False) -> dict:
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
-        transformed_update = self.__serialize(update)
+    def insert_async(self, document: dict) -> Future:
+        """
+        Queue a document for insertion and return immediately.
+        
+        Queued documents are sent in batches by a background thread, either every
+        `async_insert_wait_time` seconds or as soon as `async_insert_max_rows` documents
+        are waiting. Many small inserts therefore share one request instead of each
+        paying for a separate round trip.
+        
+        The queue is shared by every Collection object for the same collection, so
+        calling this through `client.my_database.my_collection` in a loop batches as
+        well as keeping a reference does. Call `flush()` or `close()` when you need the
+        queued documents to be stored. Don't modify a document after queueing it until
+        its future has completed.
+        
+        Args:
+            document: The document to insert
+            
+        Returns:
+            A Future resolved with the insert result of the batch containing the document,
+            or with the error raised while inserting that batch. Cancelling the future
+            before its batch is sent drops the document.
+            
+        Example:
+            ```python
+            for row in rows:
+                client.my_database.my_collection.insert_async({"content": EmbText(row)})
+            client.my_database.my_collection.flush()
+            ```
+        """
+        if self._closed:
+            raise RuntimeError("Cannot insert into a closed collection.")
+
+        # Serialize now; note that plain JSON parts of the document are shared, not copied.
+        serialized = _serialize(document)
+        future = Future()
+        self._get_insert_queue(create=True).put(serialized, future)
+        return future
+
+    def _get_insert_queue(self, create: bool = False):
+        key = (self.api_key, self._base_url)
+        with _INSERT_QUEUES_LOCK:
+            queue = _INSERT_QUEUES.get(key)
+            if queue is None and create:
+                queue = _InsertQueue(
+                    self._insert_serialized,
+                    self.async_insert_wait_time,
+                    self.async_insert_max_rows,
+                )
+                _INSERT_QUEUES[key] = queue
+            return queue
+
+    def flush(self) -> None:
+        """
+        Send every document queued by insert_async for this collection and wait until
+        the requests complete.
+        
+        Errors are reported through the futures returned by insert_async.
+        """
+        queue = self._get_insert_queue()
+        if queue is not None:
+            queue.flush()
+
+    def close(self) -> None:
+        """
+        Flush documents queued by insert_async, stop the background thread and shut
+        down the map_query worker pool.
+        
+        The insert queue and the worker pool are shared by every Collection object for
+        the same collection, so this stops them for all of them; a later insert_async or
+        map_query through another Collection object starts new ones. Queues are also closed
+        automatically at interpreter exit. Further calls to insert_async on this
+        object raise RuntimeError.
+        """
+        self._closed = True
+
+        key = (self.api_key, self._base_url)
+        with _INSERT_QUEUES_LOCK:
+            queue = _INSERT_QUEUES.pop(key, None)
+        if queue is not None:
+            queue.close()
+
+        with _QUERY_EXECUTORS_LOCK:
+            executor = _QUERY_EXECUTORS.pop(key, None)
+        if executor is not None:
+            executor.shutdown()
+
+    def update(
+        self, filter: dict, update: dict, upsert: bool = False, retryable: bool = False
+    ) -> dict:
+        url = self._base_url
+        transformed_filter = _serialize(filter)
+        transformed_update = _serialize(update)
         data = {
             "filter": transformed_filter,
             "update": transformed_update,
             "upsert": upsert,
         }
 
-        response = requests.put(url, headers=headers, json=data)
+        # Operators like $inc and $push are not idempotent, so as with insert, only
+        # retry on transient failures when the caller says it is safe.
+        session = self._session if retryable else self._write_session
+        response = session.put(url, data=_dumps(data))
+        self._query_cache.clear()
         return self.handle_response(response)
 
     def delete(self, filter: dict) -> dict:
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
+        url = self._base_url
+        transformed_filter = _serialize(filter)
         data = {"filter": transformed_filter}
 
-        response = requests.delete(url, headers=headers, json=data)
+        response = self._session.delete(url, data=_dumps(data))
+        self._query_cache.clear()
         return self.handle_response(response)
 
     def find(
@@ -358,20 +829,34 @@ class Collection:
         sort: dict = None,
         limit: int = None,
         skip: int = None,
+        cache: bool = False,
     ) -> list[dict]:
-        url = f"{self.get_collection_url()}/find"
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
-        data = {
-            "filter": transformed_filter,
-            "projection": projection,
-            "sort": sort,
-            "limit": limit,
-            "skip": skip,
-        }
+        """
+        Retrieve documents matching a filter.
+        
+        Args:
+            filter: MongoDB-style query filter
+            projection: Optional specification of which fields to include or exclude
+            sort: Optional sort specification
+            limit: Optional maximum number of documents to return
+            skip: Optional number of documents to skip
+            cache: If True, reuse the response of an identical find made through this
+                   client in the last 60 seconds. Off by default because exact-match
+                   reads are usually expected to reflect writes from other clients.
+            
+        Returns:
+            List of matching documents
+        """
+        url = self._find_url
+        options = (
+            ("projection", projection),
+            ("sort", sort),
+            ("limit", limit),
+            ("skip", skip),
+        )
+        data = {"filter": _serialize(filter), **{k: v for k, v in options if v is not None}}
 
-        response = requests.post(url, headers=headers, json=data)
-        return self.handle_response(response)
+        return self._post_coalesced(url, data, cache)
 
     def query(
         self,
@@ -381,6 +866,7 @@ class Collection:
         emb_model: str = None,
         top_k: int = None,
         include_values: bool = None,
+        cache: bool = False,
     ) -> QueryResponse:
         """
         Perform a semantic search query on the collection.
@@ -396,6 +882,11 @@ class Collection:
             emb_model: Optional embedding model to use for the query (default: "text-embedding-3-small")
             top_k: Optional maximum number of results to return (default: 10)
             include_values: Optional flag to include vector values in the response (default: False)
+            cache: If True, reuse the response of an identical query made through this
+                   client in the last 60 seconds instead of sending it again. Writes through
+                   this client clear the cache, but embeddings are processed after an insert
+                   returns, so a cached result can miss newly inserted documents for up to
+                   60 seconds. Off by default.
             
         Returns:
             QueryResponse object containing matches sorted by relevance
@@ -413,20 +904,94 @@ class Collection:
             )
             ```
         """
-        url = f"{self.get_collection_url()}/query"
-        headers = self.get_headers()
-
-        data = {"query": query}
-        if filter is not None:
-            data["filter"] = filter
-        if projection is not None:
-            data["projection"] = projection
-        if emb_model is not None:
-            data["emb_model"] = emb_model
-        if top_k is not None:
-            data["top_k"] = top_k
-        if include_values is not None:
-            data["include_values"] = include_values
-
-        response = requests.post(url, headers=headers, json=data)
+        url = self._query_url
+
+        options = (
+            ("filter", filter),
+            ("projection", projection),
+            ("emb_model", emb_model),
+            ("top_k", top_k),
+            ("include_values", include_values),
+        )
+        data = {"query": query, **{k: v for k, v in options if v is not None}}
+
+        return self._post_coalesced(url, data, cache)
+
+    def map_query(self, queries: list[str], **kwargs) -> list[QueryResponse]:
+        """
+        Run several semantic search queries in parallel.
+        
+        Queries are spread over at most `max_concurrency` worker threads (default 5),
+        which share the collection's keep-alive connections. The bound is deliberate:
+        a few parallel requests hide network latency, but flooding the service with
+        many more makes queries contend for the same index and slows every one of them
+        down. The pool is shared by every Collection object for the same collection
+        and is sized by the `max_concurrency` of the first one that calls map_query, so
+        set `Collection.max_concurrency` before the first call to change it.
+        
+        To write many documents, use insert() with a list or insert_async() rather
+        than parallel calls.
+        
+        Args:
+            queries: The texts to search for
+            **kwargs: Any other query() arguments, applied to every query
+            
+        Returns:
+            List of QueryResponse objects in the same order as queries
+            
+        Example:
+            ```python
+            results = collection.map_query(
+                ["machine learning", "vector databases", "semantic search"],
+                top_k=5,
+            )
+            ```
+        """
+        executor = _get_query_executor(self.api_key, self._base_url, self.max_concurrency)
+        return list(executor.map(lambda q: self.query(q, **kwargs), queries))
+
+    def _post_coalesced(self, url: str, data: dict, cache: bool = False):
+        """
+        POST a read-only request, sharing the round trip with identical concurrent calls.
+        
+        When several threads issue the same find/query at the same time (e.g. fan-out
+        from an agent loop), only the first one hits the network; the others wait for
+        its response and deserialize their own copy of it. With cache=True, a recent
+        successful response to the same request is reused without any network call.
+        """
+        body = _dumps(data)
+        key = (self.api_key, url, body)
+
+        if cache:
+            cached = self._query_cache.get((url, body))
+            if cached is not None:
+                return self.handle_response(cached)
+
+        # A write clears the cache and bumps its generation. Only share a response
+        # whose request started after the last write, and only cache it if no write
+        # happened while it was on the wire.
+        with _INFLIGHT_LOCK:
+            generation = self._query_cache.generation
+            entry = _INFLIGHT.get(key)
+            if entry is not None and entry[1] == generation:
+                is_leader = False
+            else:
+                entry = _INFLIGHT[key] = (Future(), generation)
+                is_leader = True
+        pending = entry[0]
+
+        if not is_leader:
+            return self.handle_response(pending.result())
+
+        try:
+            response = self._session.post(url, data=body)
+        except BaseException as e:
+            _finish_inflight(key, entry)
+            pending.set_exception(e)
+            raise
+
+        _finish_inflight(key, entry)
+        pending.set_result(response)
+        if cache and 200 <= response.status_code < 300:
+            self._query_cache.set((url, body), response, generation)
         return self.handle_response(response)
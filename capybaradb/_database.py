@@ -1,4 +1,5 @@
 from capybaradb._collection import Collection
+from capybaradb._async_collection import AsyncCollection
 
 class Database:
     """
@@ -72,6 +73,31 @@ class Database:
         """
         return Collection(self.api_key, self.project_id, self.db_name, collection_name)
 
+    def async_collection(self, collection_name: str) -> AsyncCollection:
+        """
+        Get an asynchronous collection instance within this database.
+        
+        The returned AsyncCollection exposes the same operations as Collection as
+        coroutines, so many calls can run concurrently with asyncio.gather.
+        It requires the optional `async` extra (pip install "capybaradb[async]").
+        
+        Args:
+            collection_name: The name of the collection to access
+            
+        Returns:
+            AsyncCollection: An AsyncCollection instance for the specified collection
+            
+        Example:
+            ```python
+            async with db.async_collection("my_collection") as collection:
+                results = await asyncio.gather(
+                    collection.query("first question"),
+                    collection.query("second question"),
+                )
+            ```
+        """
+        return AsyncCollection(self.api_key, self.project_id, self.db_name, collection_name)
+
     def __getattr__(self, name: str) -> Collection:
         """
         Dynamically return a 'Collection' object when accessing as an attribute.
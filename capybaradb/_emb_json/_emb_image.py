@@ -2,6 +2,11 @@ from typing import Optional, List, Dict, Any
 from ._emb_models import EmbModels
 from ._vision_models import VisionModels
 import base64
+import re
+
+# Structural check for base64 data: alphabet characters followed by at most two
+# padding characters. Matching this is much cheaper than decoding the image.
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]+={0,2}")
 
 
 class EmbImage:
@@ -27,6 +32,9 @@ class EmbImage:
         with open("path/to/image.jpg", "rb") as f:
             image_data = base64.b64encode(f.read()).decode("utf-8")
         
+        # Or pass the raw bytes; they are encoded only when the document is sent:
+        # image = EmbImage.from_bytes(open("path/to/image.jpg", "rb").read(), mime_type="image/jpeg")
+        
         # Create a document with an EmbImage field
         document = {
             "title": "Image Document",
@@ -48,33 +56,53 @@ class EmbImage:
         ```
     """
     
-    # List of supported embedding models for processing text chunks
-    SUPPORTED_EMB_MODELS = [
+    # Supported embedding models for processing text chunks
+    SUPPORTED_EMB_MODELS_TUPLE = (
         EmbModels.TEXT_EMBEDDING_3_SMALL,
         EmbModels.TEXT_EMBEDDING_3_LARGE,
         EmbModels.TEXT_EMBEDDING_ADA_002,
-    ]
+    )
     
-    # List of supported vision models for analyzing images
-    SUPPORTED_VISION_MODELS = [
+    # Supported vision models for analyzing images
+    SUPPORTED_VISION_MODELS_TUPLE = (
         VisionModels.GPT_4O_MINI,
         VisionModels.GPT_4O,
         VisionModels.GPT_4O_TURBO,
         VisionModels.GPT_O1,
-    ]
+    )
     
-    # List of supported mime types for images
-    SUPPORTED_MIME_TYPES = [
+    # Supported mime types for images
+    SUPPORTED_MIME_TYPES_TUPLE = (
         "image/jpeg",
         "image/jpg",
         "image/png",
         "image/gif",
         "image/webp",
-    ]
+    )
+
+    # Sets used for membership checks; the tuples above keep a stable order for error messages
+    SUPPORTED_EMB_MODELS = frozenset(SUPPORTED_EMB_MODELS_TUPLE)
+    SUPPORTED_VISION_MODELS = frozenset(SUPPORTED_VISION_MODELS_TUPLE)
+    SUPPORTED_MIME_TYPES = frozenset(SUPPORTED_MIME_TYPES_TUPLE)
+
+    # Documents can hold many images, so instances skip the per-object __dict__.
+    # Subclasses that need extra attributes must declare their own __slots__.
+    __slots__ = (
+        "data",
+        "mime_type",
+        "_chunks",
+        "emb_model",
+        "vision_model",
+        "max_chunk_size",
+        "chunk_overlap",
+        "is_separator_regex",
+        "separators",
+        "keep_separator",
+    )
 
     def __init__(
         self,
-        data: str,  # base64 encoded image (change this if needed)
+        data: str,  # base64 encoded image (use from_bytes for raw image bytes)
         mime_type: str,  # mime type of the image (required)
         emb_model: Optional[str] = EmbModels.TEXT_EMBEDDING_3_SMALL,
         vision_model: Optional[str] = VisionModels.GPT_4O_MINI,
@@ -83,12 +111,14 @@ class EmbImage:
         is_separator_regex: Optional[bool] = None,
         separators: Optional[List[str]] = None,
         keep_separator: Optional[bool] = None,
+        validate: bool = True,
     ):
         """
         Initialize an EmbImage object for image storage and processing.
         
         Args:
-            data: Base64-encoded image data. Must be a non-empty string.
+            data: Base64-encoded image data as a non-empty string. To pass the raw
+                  image bytes instead, use EmbImage.from_bytes.
             
             mime_type: MIME type of the image (e.g., "image/jpeg", "image/png").
                       Must be one of the supported types. This parameter is required.
@@ -109,24 +139,27 @@ class EmbImage:
             separators: List of separator strings or regex patterns.
             
             keep_separator: If True, separators remain in the chunked text.
+            
+            validate: Whether to check that data looks like base64. Set to False for
+                     trusted data, e.g. images returned by the CapybaraDB API.
         
         Raises:
             ValueError: If the data is not a valid string, if the mime_type is not supported,
                        or if the models are not supported.
         """
-        if not self.is_valid_data(data):
+        if validate and not self.is_valid_data(data):
             raise ValueError("Invalid data: must be a non-empty string containing valid base64-encoded image data.")
             
         if not self.is_valid_mime_type(mime_type):
-            supported_list = ", ".join(self.SUPPORTED_MIME_TYPES)
+            supported_list = ", ".join(self.SUPPORTED_MIME_TYPES_TUPLE)
             raise ValueError(f"Unsupported mime type: '{mime_type}'. Supported types are: {supported_list}")
 
         if emb_model is not None and not self.is_valid_emb_model(emb_model):
-            supported_list = ", ".join(self.SUPPORTED_EMB_MODELS)
+            supported_list = ", ".join(self.SUPPORTED_EMB_MODELS_TUPLE)
             raise ValueError(f"Invalid embedding model: '{emb_model}' is not supported. Supported models are: {supported_list}")
 
         if vision_model is not None and not self.is_valid_vision_model(vision_model):
-            supported_list = ", ".join(self.SUPPORTED_VISION_MODELS)
+            supported_list = ", ".join(self.SUPPORTED_VISION_MODELS_TUPLE)
             raise ValueError(f"Invalid vision model: '{vision_model}' is not supported. Supported models are: {supported_list}")
 
         self.data = data
@@ -151,16 +184,32 @@ class EmbImage:
         """Read-only property for chunks."""
         return self._chunks
 
+    @classmethod
+    def from_bytes(cls, data: bytes, mime_type: str, **kwargs) -> "EmbImage":
+        """
+        Create an EmbImage from raw image bytes.
+        
+        The bytes are kept as-is and only base64-encoded when the document is sent, so
+        the caller skips its own encoding step and the document holds the smaller raw
+        copy. Keyword arguments are passed on to the constructor.
+        
+        Raises:
+            ValueError: If data is not non-empty bytes, or for any constructor error.
+        """
+        if not (isinstance(data, bytes) and data):
+            raise ValueError("Invalid data: from_bytes requires non-empty image bytes.")
+        return cls(data, mime_type, validate=False, **kwargs)
+
     @staticmethod
     def is_valid_data(data: str) -> bool:
-        if not (isinstance(data, str) and data.strip() != ""):
-            return False
-        try:
-            # Validate that data is a valid base64 encoded string.
-            base64.b64decode(data, validate=True)
-            return True
-        except Exception:
+        """
+        Check that data is a correctly padded base64 string.
+        
+        Only the structure is checked; the image is not decoded.
+        """
+        if not (isinstance(data, str) and data):
             return False
+        return len(data) % 4 == 0 and _BASE64_RE.fullmatch(data) is not None
             
     @classmethod
     def is_valid_mime_type(cls, mime_type: str) -> bool:
@@ -180,9 +229,14 @@ class EmbImage:
         Convert the EmbImage instance to a JSON-serializable dictionary.
         Excludes all parameters with None values from the output.
         """
+        data = self.data
+        if isinstance(data, bytes):
+            # Raw bytes are encoded on demand so only the smaller raw copy is kept around
+            data = base64.b64encode(data).decode("ascii")
+
         # Start with required fields
         result = {
-            "data": self.data,
+            "data": data,
             "mime_type": self.mime_type,
         }
         
@@ -221,7 +275,7 @@ class EmbImage:
             
         mime_type = json_dict.get("mime_type")
         if mime_type is None:
-            supported_list = ", ".join(cls.SUPPORTED_MIME_TYPES)
+            supported_list = ", ".join(cls.SUPPORTED_MIME_TYPES_TUPLE)
             raise ValueError(f"JSON data must include 'mime_type' field under '@embImage'. Supported types are: {supported_list}")
 
         emb_model = json_dict.get("emb_model")
@@ -242,6 +296,8 @@ class EmbImage:
             is_separator_regex,
             separators,
             keep_separator,
+            # Data produced by the server has already been validated
+            validate=False,
         )
         instance._chunks = json_dict.get("chunks", [])
         return instance
@@ -38,11 +38,26 @@ class EmbText:
         # Later, you can perform semantic searches on this text
     """
     
-    SUPPORTED_EMB_MODELS = [
+    SUPPORTED_EMB_MODELS_TUPLE = (
         EmbModels.TEXT_EMBEDDING_3_SMALL,
         EmbModels.TEXT_EMBEDDING_3_LARGE,
         EmbModels.TEXT_EMBEDDING_ADA_002,
-    ]
+    )
+    # Set used for membership checks; the tuple above keeps a stable order
+    SUPPORTED_EMB_MODELS = frozenset(SUPPORTED_EMB_MODELS_TUPLE)
+
+    # Documents can hold many EmbText fields, so instances skip the per-object __dict__.
+    # Subclasses that need extra attributes must declare their own __slots__.
+    __slots__ = (
+        "text",
+        "_chunks",
+        "emb_model",
+        "max_chunk_size",
+        "chunk_overlap",
+        "is_separator_regex",
+        "separators",
+        "keep_separator",
+    )
 
     def __init__(
         self,